@@ -4,6 +4,7 @@ from app.agents.ba import (
     canonicalize_whitespace,
     validate_request,
     run_ba_analysis,
+    run_ba_analysis_batch,
 )
 
 from app.agents.developer import (
@@ -54,6 +55,7 @@ __all__ = [
     "canonicalize_whitespace",
     "validate_request",
     "run_ba_analysis",
+    "run_ba_analysis_batch",
     # Dev Agent exports
     "generate_implementation",
     "run_static_checks",
@@ -7,8 +7,11 @@ structured, testable requirements and user stories.
 
 from __future__ import annotations
 
-import re
-from typing import Optional, Dict, Any, List
+import asyncio
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
@@ -17,17 +20,106 @@ from app.models.schemas import BAResponse
 from app.agents.config import get_agent_config, get_llm_for_agent
 
 
+# ============================================================================
+# LLM Call Caches
+# ============================================================================
+
+# Cache key: id(llm) -> (llm, structured-output runnable)
+# get_llm_for_agent already returns a cached ChatOpenAI instance; this avoids
+# rebuilding the BAResponse structured-output chain around it on every call.
+# Holding the llm in the value keeps its id from being reused while cached.
+_structured_llm_cache: Dict[int, Tuple[Any, Any]] = {}
+
+
+def _get_structured_llm(llm: Any) -> Any:
+    """
+    Get the BAResponse structured-output runnable for an LLM instance.
+
+    Args:
+        llm: Chat model returned by get_llm_for_agent
+
+    Returns:
+        Cached runnable that yields BAResponse objects
+    """
+    cached = _structured_llm_cache.get(id(llm))
+    if cached is None:
+        # Bind structured output using Pydantic model
+        # This uses the model's native structured output capabilities
+        structured_llm = llm.with_structured_output(
+            BAResponse,
+            method="json_mode",  # Use JSON mode for guaranteed schema adherence
+        )
+        cached = (llm, structured_llm)
+        _structured_llm_cache[id(llm)] = cached
+    return cached[1]
+
+
+@lru_cache(maxsize=8)
+def _system_message(system_prompt: str) -> SystemMessage:
+    """
+    Get the system message for a prompt, built once per distinct prompt.
+
+    The system prompt is static per process, so reusing one message keeps the
+    prompt prefix byte-identical across calls (friendly to provider-side
+    prompt caching) without rebuilding the message each request.
+    """
+    return SystemMessage(content=system_prompt)
+
+
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+# Cache key: blake2b digest of (project_id, canonical request text) -> result
+# Only "complete" results are stored so clarifications and failures are retried
+_RESPONSE_CACHE_MAXSIZE = 128
+_response_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+
+def _response_cache_key(cleaned_text: str, project_id: Optional[str]) -> str:
+    """Build the response cache key for a canonicalized request."""
+    raw = f"{project_id or ''}\0{cleaned_text}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _copy_complete_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep-copy a complete result so the caller and the cache never share it.
+
+    BAResponse is frozen, but its user_stories list is not, and ba_node hands
+    that list to the task; without a copy a mutation would corrupt the cache.
+    """
+    response = result["response"].model_copy(deep=True)
+    return {
+        "status": result["status"],
+        "response": response,
+        "user_stories": response.user_stories,
+    }
+
+
 # ============================================================================
 # BA Agent Functions
 # ============================================================================
 
+# Upper bound on request length, checked before any scan of the text
+_MAX_REQUEST_CHARS = 10000
+
 
 def canonicalize_whitespace(text: str) -> str:
     """Canonicalize whitespace in text."""
-    # Replace multiple whitespace characters with a single space
-    text = re.sub(r"\s+", " ", text)
-    # Strip leading and trailing whitespace
-    return text.strip()
+    # Fast path: most requests are already canonical. isprintable() is False
+    # for every whitespace character except the ASCII space, so text with no
+    # doubled or edge spaces needs no work and is returned as-is
+    if (
+        text[:1] != " "
+        and text[-1:] != " "
+        and "  " not in text
+        and text.isprintable()
+    ):
+        return text
+    # split() drops leading/trailing whitespace and splits on runs of any
+    # Unicode whitespace in one C-level pass; rejoin with single spaces
+    return " ".join(text.split())
 
 
 def validate_request(text: str) -> tuple[bool, Optional[str]]:
@@ -37,11 +129,16 @@ def validate_request(text: str) -> tuple[bool, Optional[str]]:
     Returns:
         tuple: (is_valid, error_message)
     """
-    if not text:
-        return False, "Request text cannot be empty"
+    # Length is O(1), so reject oversized input before scanning it
+    if len(text) > _MAX_REQUEST_CHARS:
+        return (
+            False,
+            f"Request text exceeds maximum length of {_MAX_REQUEST_CHARS} characters",
+        )
 
-    if len(text) > 10000:
-        return False, "Request text exceeds maximum length of 10000 characters"
+    # isspace() scans in C without allocating a stripped copy
+    if not text or text.isspace():
+        return False, "Request text cannot be empty"
 
     return True, None
 
@@ -58,6 +155,10 @@ async def run_ba_analysis(
     3. Parses and validates the structured response
     4. Returns results with appropriate status
 
+    When settings.BA_CACHE_ENABLED is set (off by default), completed analyses
+    are cached per canonicalized request and project for the life of the
+    process, so repeats skip the LLM call and get a copy of the first answer.
+
     Args:
         request_text: The user request to analyze
         project_id: Optional project ID for context retrieval
@@ -80,22 +181,25 @@ async def run_ba_analysis(
     if not settings.OPENROUTER_API_KEY:
         return {"status": "error", "error": "OPENROUTER_API_KEY not configured"}
 
+    # Serve identical, already-completed requests without an LLM round-trip
+    cache_key = None
+    if settings.BA_CACHE_ENABLED:
+        cache_key = _response_cache_key(cleaned_text, project_id)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            _response_cache.move_to_end(cache_key)
+            return _copy_complete_result(cached)
+
     # Step 4: Initialize LLM with structured output
     # Using with_structured_output guarantees valid JSON matching BAResponse schema
     # Load config once (cached via get_config singleton)
     agent_config = get_agent_config("ba")
     llm = get_llm_for_agent(agent_config)
-
-    # Bind structured output using Pydantic model
-    # This uses the model's native structured output capabilities
-    structured_llm = llm.with_structured_output(
-        BAResponse,
-        method="json_mode",  # Use JSON mode for guaranteed schema adherence
-    )
+    structured_llm = _get_structured_llm(llm)
 
     # Step 5: Prepare messages
     messages = [
-        SystemMessage(content=agent_config.system_prompt),
+        _system_message(agent_config.system_prompt),
         HumanMessage(content=cleaned_text),
     ]
 
@@ -119,8 +223,35 @@ async def run_ba_analysis(
         }
     else:
         # Clear request - requirements complete
-        return {
+        result = {
             "status": "complete",
             "response": ba_response,
             "user_stories": ba_response.user_stories,
         }
+        if cache_key is not None:
+            _response_cache[cache_key] = _copy_complete_result(result)
+            if len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+                _response_cache.popitem(last=False)
+        return result
+
+
+async def run_ba_analysis_batch(
+    request_texts: List[str], project_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run BA analysis on several requests concurrently.
+
+    Each request goes through run_ba_analysis (validation, cache, LLM call),
+    and the LLM calls are awaited together with asyncio.gather so independent
+    requests overlap instead of running back to back.
+
+    Args:
+        request_texts: The user requests to analyze
+        project_id: Optional project ID shared by all requests
+
+    Returns:
+        List of run_ba_analysis result dicts, in the same order as request_texts
+    """
+    return await asyncio.gather(
+        *(run_ba_analysis(text, project_id) for text in request_texts)
+    )
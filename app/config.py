@@ -59,6 +59,13 @@ class Settings(BaseSettings):
         default=False, description="Enable LangSmith tracing"
     )
 
+    # BA Agent Configuration
+    BA_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Reuse completed BA analyses for identical requests "
+        "(entries never expire, so resubmitting returns the first answer)",
+    )
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
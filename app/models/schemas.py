@@ -62,6 +62,8 @@ class BARequest(BaseModel):
 class UserStory(BaseModel):
     """A single user story with acceptance criteria."""
 
+    model_config = {"frozen": True}
+
     id: str = Field(..., description="Unique identifier for the user story")
     title: str = Field(..., description="Short title of the user story")
     description: str = Field(..., description="Detailed description of the user story")
@@ -71,7 +73,12 @@ class UserStory(BaseModel):
 
 
 class BAResponse(BaseModel):
-    """Response model from BA analysis."""
+    """Response model from BA analysis.
+
+    Frozen because completed analyses are cached and shared between callers.
+    """
+
+    model_config = {"frozen": True}
 
     title: str = Field(..., description="Title of the analyzed requirement")
     description: str = Field(..., description="Detailed description of the requirement")
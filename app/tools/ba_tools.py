@@ -9,20 +9,24 @@ BA has:
 
 from __future__ import annotations
 
-import os
-import pathlib
 import hashlib
+import json
 from typing import List
 from langchain.tools import tool
 
+from app.chat_memory import get_session_history
 
 # Import the underlying logic, not the decorated tools
 from app.tools.file_tools import (
+    _project_root,
     _resolve_and_validate,
+    _scan_files,
     FileToolError,
-    WORKSPACE_ROOT,
 )
 
+# File extensions the BA is allowed to write
+REQUIREMENT_DOC_EXTENSIONS = (".md", ".markdown", ".yaml", ".yml")
+
 
 @tool
 def ba_read_file(path: str, project_id: str) -> str:
@@ -43,9 +47,9 @@ def ba_read_file(path: str, project_id: str) -> str:
     """
     try:
         target = _resolve_and_validate(path, project_id)
-        if not target.exists():
-            return f"Error: File not found at {path}"
         return target.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return f"Error: File not found at {path}"
     except FileToolError as e:
         return f"Error reading file: {e}"
 
@@ -66,16 +70,7 @@ def ba_list_files(directory: str, project_id: str) -> str:
         target = _resolve_and_validate(directory, project_id)
         if not target.exists():
             return ""
-        files = []
-        for root, _, filenames in os.walk(target):
-            for fn in filenames:
-                rel = (
-                    pathlib.Path(root)
-                    .joinpath(fn)
-                    .relative_to(WORKSPACE_ROOT / project_id)
-                )
-                files.append(str(rel))
-        return ", ".join(files)
+        return ", ".join(_scan_files(target, project_id))
     except FileToolError as e:
         return f"Error listing files: {e}"
 
@@ -92,13 +87,10 @@ def ba_read_directory_structure(project_id: str) -> str:
         Comma-separated list of all paths in the project
     """
     try:
-        root = (WORKSPACE_ROOT / project_id).resolve()
+        root = _project_root(project_id)
         if not root.exists():
             return ""
-        paths = []
-        for p in root.rglob("*"):
-            paths.append(str(p.relative_to(root)))
-        return ", ".join(paths)
+        return ", ".join(_scan_files(root, project_id, include_dirs=True))
     except FileToolError as e:
         return f"Error reading directory structure: {e}"
 
@@ -122,30 +114,25 @@ def ba_write_requirement_doc(
     Returns:
         JSON string with operation result including path, size, checksum, and dry_run status
     """
-    import json
-
     # Validate file extension
-    allowed_extensions = (".md", ".markdown", ".yaml", ".yml")
-    path_lower = path.lower()
-
-    if not any(path_lower.endswith(ext) for ext in allowed_extensions):
+    if not path.lower().endswith(REQUIREMENT_DOC_EXTENSIONS):
         return json.dumps(
             {
-                "error": f"BA can only write requirement documents with extensions: {allowed_extensions}.",
+                "error": f"BA can only write requirement documents with extensions: {REQUIREMENT_DOC_EXTENSIONS}.",
                 "path": path,
             }
         )
 
     try:
         target = _resolve_and_validate(path, project_id)
-        rel = target.relative_to(WORKSPACE_ROOT / project_id)
+        rel = target.relative_to(_project_root(project_id))
         content_bytes = content.encode("utf-8")
         if len(content_bytes) > 5 * 1024 * 1024:
             return json.dumps({"error": "File too large"})
         checksum = hashlib.sha256(content_bytes).hexdigest()
         if not dry_run:
             target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(content, encoding="utf-8")
+            target.write_bytes(content_bytes)
         return json.dumps(
             {
                 "success": True,
@@ -172,31 +159,30 @@ def ba_read_conversation_history(session_id: str) -> str:
     Returns:
         JSON string with list of messages or error
     """
-    import json
-    from app.chat_memory import get_session_history
-
     try:
         history = get_session_history(session_id)
-        return json.dumps(history)
+        # Compact, unescaped output keeps the string (and the tool result fed
+        # back to the LLM) as small as the stdlib C encoder can make it
+        return json.dumps(history, ensure_ascii=False, separators=(",", ":"))
     except Exception as e:
         return json.dumps({"error": f"Cannot read conversation history: {e}"})
 
 
-# List of BA tools for agent binding
-BA_TOOLS = [
+# BA tools for agent binding (immutable, so it can be shared as-is)
+BA_TOOLS = (
     ba_read_file,
     ba_list_files,
     ba_read_directory_structure,
     ba_write_requirement_doc,
     ba_read_conversation_history,
-]
+)
 
 
-def get_ba_tools() -> list:
+def get_ba_tools() -> tuple:
     """
-    Get the list of BA agent tools for LangChain agent binding.
+    Get the BA agent tools for LangChain agent binding.
 
     Returns:
-        List of tool functions decorated with @tool
+        Tuple of tool functions decorated with @tool
     """
-    return BA_TOOLS.copy()
+    return BA_TOOLS
@@ -7,6 +7,7 @@ Safety checks: path validation, sandboxing, protected paths.
 
 import os
 import pathlib
+import functools
 import hashlib
 import re
 from typing import List, Tuple, Any, Dict
@@ -42,13 +43,30 @@ WORKSPACE_ROOT = pathlib.Path(os.environ.get("WORKSPACE_ROOT", "workspace")).res
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _workspace_path(workspace_root: pathlib.Path, project_id: str) -> pathlib.Path:
+    """Build a project's workspace path; cached per (workspace_root, project_id)."""
+    return workspace_root / project_id
+
+
+def _project_root(project_id: str) -> pathlib.Path:
+    """
+    Return the workspace root for a project without creating it.
+
+    WORKSPACE_ROOT is read on every call and is part of the cache key, so
+    tests that monkeypatch it never see a stale root. Callers that write
+    must create the directory themselves (see _resolve_and_validate).
+    """
+    return _workspace_path(WORKSPACE_ROOT, project_id)
+
+
 def _resolve_and_validate(path: str, project_id: str) -> pathlib.Path:
     """Resolve and validate a path within the project workspace."""
     if os.path.isabs(path):
         raise FileToolError("Absolute paths are not allowed")
     if ".." in pathlib.Path(path).parts:
         raise FileToolError("Parent traversal is not allowed")
-    project_root = WORKSPACE_ROOT / project_id
+    project_root = _project_root(project_id)
     project_root.mkdir(parents=True, exist_ok=True)
     target = (project_root / path).resolve()
     try:
@@ -64,6 +82,44 @@ def _resolve_and_validate(path: str, project_id: str) -> pathlib.Path:
     return target
 
 
+def _scan_files(
+    target: pathlib.Path, project_id: str, include_dirs: bool = False
+) -> List[str]:
+    """
+    Recursively collect files under target as paths relative to the project root.
+
+    Walks with os.scandir and slices the project prefix off each entry path,
+    so no intermediate Path objects are built per file. Like os.walk, symlinked
+    directories are not descended into.
+
+    Args:
+        target: Resolved directory inside the project workspace
+        project_id: Project identifier
+        include_dirs: If True, also include directory paths
+
+    Returns:
+        List of relative file (and optionally directory) paths
+    """
+    prefix_len = len(str(_project_root(project_id))) + len(os.sep)
+    files = []
+    stack = [str(target)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    if include_dirs:
+                        files.append(entry.path[prefix_len:])
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    files.append(entry.path[prefix_len:])
+    return files
+
+
 def _read_file_impl(path: str, project_id: str) -> str:
     """
     Core implementation to read a file from the project workspace.
@@ -76,9 +132,10 @@ def _read_file_impl(path: str, project_id: str) -> str:
         File contents as string
     """
     target = _resolve_and_validate(path, project_id)
-    if not target.exists():
+    try:
+        return target.read_text(encoding="utf-8")
+    except FileNotFoundError:
         raise FileToolError("File not found")
-    return target.read_text(encoding="utf-8")
 
 
 @tool
@@ -110,14 +167,7 @@ def _list_files_impl(directory: str, project_id: str) -> List[str]:
     target = _resolve_and_validate(directory, project_id)
     if not target.exists():
         return []
-    files = []
-    for root, _, filenames in os.walk(target):
-        for fn in filenames:
-            rel = (
-                pathlib.Path(root).joinpath(fn).relative_to(WORKSPACE_ROOT / project_id)
-            )
-            files.append(str(rel))
-    return files
+    return _scan_files(target, project_id)
 
 
 @tool
@@ -145,13 +195,10 @@ def _read_directory_structure_impl(project_id: str) -> List[str]:
     Returns:
         List of all paths in the project
     """
-    root = (WORKSPACE_ROOT / project_id).resolve()
+    root = _project_root(project_id)
     if not root.exists():
         return []
-    out = []
-    for p in root.rglob("*"):
-        out.append(str(p.relative_to(root)))
-    return out
+    return _scan_files(root, project_id, include_dirs=True)
 
 
 @tool
@@ -168,9 +215,34 @@ def read_directory_structure(project_id: str) -> List[str]:
     return _read_directory_structure_impl(project_id)
 
 
-def _checksum(s: str) -> str:
-    """Generate SHA256 checksum of a string."""
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def _checksum(data: bytes) -> str:
+    """Generate SHA256 checksum of already-encoded content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+# Characters encoded per step when sizing/hashing content that is not written
+_CHECKSUM_CHUNK_CHARS = 64 * 1024
+
+
+def _size_and_checksum(content: str) -> Tuple[int, str]:
+    """
+    Compute the UTF-8 size and SHA256 checksum of a string chunk by chunk.
+
+    Avoids holding a full encoded copy of the content alongside the string.
+
+    Args:
+        content: Text content
+
+    Returns:
+        Tuple of (size in bytes, hex checksum)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for start in range(0, len(content), _CHECKSUM_CHUNK_CHARS):
+        chunk = content[start : start + _CHECKSUM_CHUNK_CHARS].encode("utf-8")
+        size += len(chunk)
+        digest.update(chunk)
+    return size, digest.hexdigest()
 
 
 def _write_file_impl(
@@ -189,15 +261,22 @@ def _write_file_impl(
         Dict with success, path, size, checksum, diff (dry_run), message
     """
     target = _resolve_and_validate(path, project_id)
-    rel = target.relative_to(WORKSPACE_ROOT / project_id)
-    content_bytes = content.encode("utf-8")
+    project_root = _project_root(project_id)
+    rel = target.relative_to(project_root)
+
+    # A dry run never writes, so size and hash the content without keeping
+    # a full encoded copy around
+    if dry_run:
+        size, checksum = _size_and_checksum(content)
+    else:
+        content_bytes = content.encode("utf-8")
+        size = len(content_bytes)
+        checksum = _checksum(content_bytes)
 
     # Size limit 1MB
-    if len(content_bytes) > 1024 * 1024:
+    if size > 1024 * 1024:
         raise FileToolError("File size exceeds 1MB limit")
 
-    checksum = _checksum(content)
-
     # Basic content validation
     suspicious_patterns = [r"__import__\(\'os\'\)", r"exec\(", r"eval\(", r"compile\("]
     if rel.suffix.lower() == ".py" and any(
@@ -208,7 +287,6 @@ def _write_file_impl(
         )
 
     # Audit log BEFORE any write
-    project_root = WORKSPACE_ROOT / project_id
     audit_path = project_root / "audit.log"
     project_root.mkdir(parents=True, exist_ok=True)
 
@@ -217,7 +295,7 @@ def _write_file_impl(
         "action": "write_file",
         "project_id": project_id,
         "path": str(rel),
-        "size_bytes": len(content_bytes),
+        "size_bytes": size,
         "checksum": checksum,
         "dry_run": dry_run,
     }
@@ -226,27 +304,29 @@ def _write_file_impl(
         f.write(json.dumps(audit_entry) + "\n")
 
     logger.info(
-        f"Write audit logged: project={project_id}, path={rel}, size={len(content_bytes)}, checksum={checksum[:8]}..., dry_run={dry_run}"
+        f"Write audit logged: project={project_id}, path={rel}, size={size}, checksum={checksum[:8]}..., dry_run={dry_run}"
     )
 
     if dry_run:
         diff = None
         diff_size = 0
-        if target.exists():
-            try:
-                old_content = target.read_text(encoding="utf-8")
-                diff_lines = difflib.unified_diff(
-                    old_content.splitlines(keepends=True),
-                    content.splitlines(keepends=True),
-                    fromfile=f"a/{rel}",
-                    tofile=f"b/{rel}",
-                    n=3,
-                )
-                diff = "".join(diff_lines)
-                diff_size = len(diff)
-            except Exception as e:
-                logger.warning(f"Dry-run diff failed for {rel}: {e}")
-                diff = "diff computation failed"
+        try:
+            old_content = target.read_text(encoding="utf-8")
+            diff_lines = difflib.unified_diff(
+                old_content.splitlines(keepends=True),
+                content.splitlines(keepends=True),
+                fromfile=f"a/{rel}",
+                tofile=f"b/{rel}",
+                n=3,
+            )
+            diff = "".join(diff_lines)
+            diff_size = len(diff)
+        except FileNotFoundError:
+            # New file: nothing to diff against
+            pass
+        except Exception as e:
+            logger.warning(f"Dry-run diff failed for {rel}: {e}")
+            diff = "diff computation failed"
 
         message = (
             "dry_run new file"
@@ -258,7 +338,7 @@ def _write_file_impl(
         return {
             "success": True,
             "path": str(rel),
-            "size": len(content_bytes),
+            "size": size,
             "checksum": checksum,
             "diff": diff,
             "message": message,
@@ -266,7 +346,8 @@ def _write_file_impl(
 
     # Perform write
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(content, encoding="utf-8")
+    # Reuse the buffer that was sized and hashed rather than encoding again
+    target.write_bytes(content_bytes)
 
     logger.info(f"File written successfully: {rel}")
 
@@ -279,7 +360,7 @@ def _write_file_impl(
     return {
         "success": True,
         "path": str(rel),
-        "size": len(content_bytes),
+        "size": size,
         "checksum": checksum,
         "diff": None,
         "message": "written successfully",
@@ -305,20 +386,20 @@ def write_file(
     return _write_file_impl(path, content, project_id, dry_run)
 
 
-# List of all file tools for agent binding
-FILE_TOOLS = [
+# All file tools for agent binding (immutable, so it can be shared as-is)
+FILE_TOOLS = (
     read_file,
     list_files,
     read_directory_structure,
     write_file,
-]
+)
 
 
-def get_file_tools() -> List:
+def get_file_tools() -> Tuple:
     """
-    Get the list of file tools for LangChain agent binding.
+    Get the file tools for LangChain agent binding.
 
     Returns:
-        List of tool functions decorated with @tool
+        Tuple of tool functions decorated with @tool
     """
-    return FILE_TOOLS.copy()
+    return FILE_TOOLS
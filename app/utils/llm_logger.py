@@ -32,6 +32,13 @@ MODEL_PRICING = {
     "claude-3-haiku": {"input": 0.00025, "output": 0.00125},
 }
 
+# Per-1K-token rates scaled to integer nano-USD (input, output), built once at
+# import so calculate_cost does a single dict lookup and integer math
+_PRICING_SCALED = {
+    model: (round(rates["input"] * 1e9), round(rates["output"] * 1e9))
+    for model, rates in MODEL_PRICING.items()
+}
+
 
 def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     """Calculate the cost of an LLM request.
@@ -44,10 +51,8 @@ def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     Returns:
         Total cost in USD.
     """
-    pricing = MODEL_PRICING.get(model, {"input": 0.0, "output": 0.0})
-    input_cost = (input_tokens / 1000) * pricing["input"]
-    output_cost = (output_tokens / 1000) * pricing["output"]
-    return round(input_cost + output_cost, 6)
+    input_rate, output_rate = _PRICING_SCALED.get(model, (0, 0))
+    return (input_tokens * input_rate + output_tokens * output_rate) / 1e12
 
 
 class LLMLoggingCallback(BaseCallbackHandler):
@@ -89,12 +94,19 @@ class LLMLoggingCallback(BaseCallbackHandler):
         self.input_tokens = 0
         self.output_tokens = 0
 
+        # Skip building the record entirely when INFO is filtered out
+        if not llm_logger.isEnabledFor(logging.INFO):
+            return
+
+        prompt_count = len(prompts)
         llm_logger.info(
-            f"LLM Start | Model: {self.model} | Prompts: {len(prompts)}",
+            "LLM Start | Model: %s | Prompts: %s",
+            self.model,
+            prompt_count,
             extra={
                 "event": "llm_start",
                 "model": self.model,
-                "prompt_count": len(prompts),
+                "prompt_count": prompt_count,
                 "session_id": self.session_id,
             },
         )
@@ -115,19 +127,32 @@ class LLMLoggingCallback(BaseCallbackHandler):
             self.input_tokens = getattr(response.usage, "prompt_tokens", 0)
             self.output_tokens = getattr(response.usage, "completion_tokens", 0)
 
+        console_enabled = logger.isEnabledFor(logging.INFO)
+        file_enabled = llm_logger.isEnabledFor(logging.INFO)
+        if not console_enabled and not file_enabled:
+            return
+
         total_tokens = self.input_tokens + self.output_tokens
         cost_usd = calculate_cost(self.model, self.input_tokens, self.output_tokens)
 
         # Log to console
-        logger.info(
-            f"LLM Complete | {self.model} | "
-            f"Tokens: {self.input_tokens}in/{self.output_tokens}out "
-            f"({total_tokens} total) | Cost: ${cost_usd:.6f}"
-        )
+        if console_enabled:
+            logger.info(
+                "LLM Complete | %s | Tokens: %sin/%sout (%s total) | Cost: $%.6f",
+                self.model,
+                self.input_tokens,
+                self.output_tokens,
+                total_tokens,
+                cost_usd,
+            )
 
         # Log detailed info to LLM log file
+        if not file_enabled:
+            return
+
         llm_logger.info(
-            f"LLM Complete | Model: {self.model}",
+            "LLM Complete | Model: %s",
+            self.model,
             extra={
                 "event": "llm_complete",
                 "model": self.model,
@@ -153,12 +178,19 @@ class LLMLoggingCallback(BaseCallbackHandler):
             **kwargs: Additional arguments.
         """
         logger.error(
-            f"LLM Error | Model: {self.model} | Error: {error}",
+            "LLM Error | Model: %s | Error: %s",
+            self.model,
+            error,
             exc_info=True,
         )
 
+        if not llm_logger.isEnabledFor(logging.ERROR):
+            return
+
         llm_logger.error(
-            f"LLM Error | Model: {self.model} | Error: {str(error)}",
+            "LLM Error | Model: %s | Error: %s",
+            self.model,
+            error,
             extra={
                 "event": "llm_error",
                 "model": self.model,
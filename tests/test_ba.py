@@ -3,25 +3,150 @@ Unit tests for BA (Business Analyst) Agent.
 
 Tests cover:
 - Input validation
-- JSON parsing resilience
+- Whitespace canonicalization
 - Response handling for ambiguous vs concrete inputs
 - Schema validation
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
+from pydantic import ValidationError
 
+from app.agents import ba
 from app.agents.ba import (
     canonicalize_whitespace,
     validate_request,
     run_ba_analysis,
+    run_ba_analysis_batch,
 )
 from app.models.schemas import BAResponse, UserStory
 
 
+# ============================================================================
+# Test Helpers
+# ============================================================================
+
+
+def make_async_return(value):
+    """Build a coroutine function that returns value (cheaper than AsyncMock)."""
+
+    async def _return(*args, **kwargs):
+        return value
+
+    return _return
+
+
+def make_async_raise(exc):
+    """Build a coroutine function that raises exc (cheaper than AsyncMock)."""
+
+    async def _raise(*args, **kwargs):
+        raise exc
+
+    return _raise
+
+
+def make_ba_settings(**overrides):
+    """Build a plain stand-in for the settings read by app.agents.ba."""
+    values = {
+        "OPENROUTER_API_KEY": "test-api-key",
+        "OPENAI_MODEL": "test-model",
+        "OPENAI_API_BASE": "https://test.api/v1",
+        "BA_CACHE_ENABLED": False,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture
+def mock_ba_env(monkeypatch):
+    """Stub BA settings and get_llm_for_agent; return the mock LLM."""
+    monkeypatch.setattr(ba, "settings", make_ba_settings())
+    llm = Mock()
+    monkeypatch.setattr(ba, "get_llm_for_agent", lambda *args, **kwargs: llm)
+    return llm
+
+
+# ============================================================================
+# Shared Request Texts
+# ============================================================================
+
+# Boundary-length inputs around validate_request's 10000 character limit
+_LEN_9999 = "a" * 9999
+_LEN_10000 = "a" * 10000
+_LEN_10001 = "a" * 10001
+
+_UNICODE_TEXT = "Build a 登录 system with 🔐 security"
+
+
+# ============================================================================
+# Shared LLM Responses
+# ============================================================================
+
+# Built once with model_construct (no validation) since these only stand in
+# for what the mocked structured LLM returns; run_ba_analysis never mutates them
+
+# Ambiguous request: clarifying questions, no user stories
+_CLARIFY_RESPONSE = BAResponse.model_construct(
+    title="Vague Request",
+    description="Needs clarification",
+    user_stories=[],
+    questions=[
+        "What specific features do you need?",
+        "Who are the target users?",
+        "What is the timeline?",
+    ],
+    priority=None,
+)
+
+# Concrete request: user stories, no questions
+_COMPLETE_RESPONSE = BAResponse.model_construct(
+    title="User Login System",
+    description="Implement user authentication",
+    user_stories=[
+        UserStory.model_construct(
+            id="US-001",
+            title="Login with Email",
+            description="As a user, I want to log in with email",
+            acceptance_criteria=[
+                "User can enter email",
+                "System validates email format",
+            ],
+        ),
+        UserStory.model_construct(
+            id="US-002",
+            title="Login with Password",
+            description="As a user, I want to log in with password",
+            acceptance_criteria=[
+                "User can enter password",
+                "System validates password",
+            ],
+        ),
+    ],
+    questions=[],
+    priority="high",
+)
+
+_PROJECT_RESPONSE = BAResponse.model_construct(
+    title="Test",
+    description="Test",
+    user_stories=[],
+    questions=["Question 1?"],
+    priority=None,
+)
+
+_SPECIAL_CHARS_RESPONSE = BAResponse.model_construct(
+    title='Test "quoted" title',
+    description="Test with \n newlines and \t tabs",
+    user_stories=[],
+    questions=["Question with <special> & chars?"],
+    priority="high",
+)
+
+
 # ============================================================================
 # Test Input Validation
 # ============================================================================
@@ -39,15 +164,12 @@ class TestValidateRequest:
     def test_whitespace_only_returns_error(self):
         """Whitespace-only text should return validation error."""
         is_valid, error = validate_request("   \n\t  ")
-        # After canonicalization this becomes empty, but validation happens before
-        # So this should pass validation (has content), but be canonicalized later
-        is_valid, error = validate_request("")
         assert not is_valid
+        assert "empty" in error.lower()
 
     def test_long_text_returns_error(self):
         """Text exceeding 10000 chars should return error."""
-        long_text = "a" * 10001
-        is_valid, error = validate_request(long_text)
+        is_valid, error = validate_request(_LEN_10001)
         assert not is_valid
         assert "10000" in error
 
@@ -59,8 +181,7 @@ class TestValidateRequest:
 
     def test_text_at_limit_passes(self):
         """Text exactly at 10000 chars should pass."""
-        text = "a" * 10000
-        is_valid, error = validate_request(text)
+        is_valid, error = validate_request(_LEN_10000)
         assert is_valid
         assert error is None
 
@@ -93,6 +214,16 @@ class TestCanonicalizeWhitespace:
         result = canonicalize_whitespace("  hello   \t\n  world  ")
         assert result == "hello world"
 
+    def test_already_canonical_text_unchanged(self):
+        """Text without whitespace runs should come back unchanged."""
+        text = "Build a login system with 登录"
+        assert canonicalize_whitespace(text) is text
+
+    def test_unicode_whitespace_collapsed(self):
+        """Form feeds, vertical tabs and non-breaking spaces count as whitespace."""
+        result = canonicalize_whitespace("\u00a0hello\f\v\u2003world\u3000")
+        assert result == "hello world"
+
 
 # ============================================================================
 # Test Run BA Analysis - Mocked LLM
@@ -102,39 +233,14 @@ class TestCanonicalizeWhitespace:
 class TestRunBAAnalysis:
     """Test the main BA analysis function with mocked LLM."""
 
-    @pytest.fixture
-    def mock_settings(self):
-        """Mock settings with API key."""
-        with patch("app.agents.ba.settings") as mock:
-            mock.OPENROUTER_API_KEY = "test-api-key"
-            mock.OPENAI_MODEL = "test-model"
-            mock.OPENAI_API_BASE = "https://test.api/v1"
-            yield mock
-
     @pytest.mark.asyncio
-    async def test_ambiguous_request_returns_clarify_status(self, mock_settings):
+    async def test_ambiguous_request_returns_clarify_status(self, mock_ba_env):
         """Ambiguous input should return 'clarify' status with questions."""
-        # Mock structured LLM response with clarifying questions
-        mock_ba_response = BAResponse(
-            title="Vague Request",
-            description="Needs clarification",
-            user_stories=[],
-            questions=[
-                "What specific features do you need?",
-                "Who are the target users?",
-                "What is the timeline?",
-            ],
-            priority=None,
-        )
-
-        with patch("app.agents.ba.get_llm_for_agent") as mock_get_llm:
-            mock_llm = mock_get_llm.return_value
-            # Mock with_structured_output to return a mock that directly returns BAResponse
-            mock_structured = AsyncMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_ba_response)
-            mock_llm.with_structured_output = Mock(return_value=mock_structured)
+        # Mock with_structured_output to return a mock that directly returns BAResponse
+        mock_structured = SimpleNamespace(ainvoke=make_async_return(_CLARIFY_RESPONSE))
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
 
-            result = await run_ba_analysis("Make the app better")
+        result = await run_ba_analysis("Make the app better")
 
         assert result["status"] == "clarify"
         assert "questions" in result
@@ -142,46 +248,13 @@ class TestRunBAAnalysis:
         assert isinstance(result["response"], BAResponse)
 
     @pytest.mark.asyncio
-    async def test_concrete_request_returns_complete_status(self, mock_settings):
+    async def test_concrete_request_returns_complete_status(self, mock_ba_env):
         """Concrete input should return 'complete' status with user stories."""
-        # Mock structured LLM response with user stories
-        mock_ba_response = BAResponse(
-            title="User Login System",
-            description="Implement user authentication",
-            user_stories=[
-                UserStory(
-                    id="US-001",
-                    title="Login with Email",
-                    description="As a user, I want to log in with email",
-                    acceptance_criteria=[
-                        "User can enter email",
-                        "System validates email format",
-                    ],
-                ),
-                UserStory(
-                    id="US-002",
-                    title="Login with Password",
-                    description="As a user, I want to log in with password",
-                    acceptance_criteria=[
-                        "User can enter password",
-                        "System validates password",
-                    ],
-                ),
-            ],
-            questions=[],
-            priority="high",
-        )
+        # Mock with_structured_output to return a mock that directly returns BAResponse
+        mock_structured = SimpleNamespace(ainvoke=make_async_return(_COMPLETE_RESPONSE))
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
 
-        with patch("app.agents.ba.get_llm_for_agent") as mock_get_llm:
-            mock_llm = mock_get_llm.return_value
-            # Mock with_structured_output to return a mock that directly returns BAResponse
-            mock_structured = AsyncMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_ba_response)
-            mock_llm.with_structured_output = Mock(return_value=mock_structured)
-
-            result = await run_ba_analysis(
-                "Build a login system with email and password"
-            )
+        result = await run_ba_analysis("Build a login system with email and password")
 
         assert result["status"] == "complete"
         assert "user_stories" in result
@@ -192,7 +265,7 @@ class TestRunBAAnalysis:
             assert len(story.acceptance_criteria) > 0
 
     @pytest.mark.asyncio
-    async def test_empty_request_returns_error(self, mock_settings):
+    async def test_empty_request_returns_error(self, mock_ba_env):
         """Empty request should return error status."""
         result = await run_ba_analysis("")
 
@@ -200,71 +273,100 @@ class TestRunBAAnalysis:
         assert "empty" in result["error"].lower()
 
     @pytest.mark.asyncio
-    async def test_missing_api_key_returns_error(self):
+    async def test_missing_api_key_returns_error(self, monkeypatch):
         """Missing API key should return error status."""
-        with patch("app.agents.ba.settings") as mock:
-            mock.OPENROUTER_API_KEY = None
+        monkeypatch.setattr(ba, "settings", make_ba_settings(OPENROUTER_API_KEY=None))
 
-            result = await run_ba_analysis("Build something")
+        result = await run_ba_analysis("Build something")
 
         assert result["status"] == "error"
         assert "OPENROUTER_API_KEY" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_llm_failure_returns_error(self, mock_settings):
-        """LLM call failure should return error status."""
-        with patch("app.agents.ba.get_llm_for_agent") as mock_get_llm:
-            mock_llm = mock_get_llm.return_value
-            # Mock with_structured_output to return a mock whose ainvoke raises
-            mock_structured = AsyncMock()
-            mock_structured.ainvoke = AsyncMock(side_effect=Exception("LLM Error"))
-            mock_llm.with_structured_output = Mock(return_value=mock_structured)
+    @pytest.mark.parametrize("error_message", ["LLM Error", "Structured output error"])
+    async def test_llm_failure_returns_error(self, mock_ba_env, error_message):
+        """LLM or structured output failure should return error status."""
+        # Mock with_structured_output to return a mock whose ainvoke raises
+        mock_structured = SimpleNamespace(
+            ainvoke=make_async_raise(Exception(error_message))
+        )
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
 
-            result = await run_ba_analysis("Build something")
+        result = await run_ba_analysis("Build something")
 
         assert result["status"] == "error"
         assert "LLM" in result["error"]
+        assert "structured output" in result["error"].lower()
+        assert error_message in result["error"]
 
     @pytest.mark.asyncio
-    async def test_structured_output_failure_returns_error(self, mock_settings):
-        """Structured output failure from LLM should return error status."""
-        with patch("app.agents.ba.get_llm_for_agent") as mock_get_llm:
-            mock_llm = mock_get_llm.return_value
-            # Mock with_structured_output to raise an exception
-            mock_structured = AsyncMock()
-            mock_structured.ainvoke = AsyncMock(
-                side_effect=Exception("Structured output error")
-            )
-            mock_llm.with_structured_output = Mock(return_value=mock_structured)
-
-            result = await run_ba_analysis("Build something")
+    async def test_request_with_project_id(self, mock_ba_env):
+        """Request with project_id should be processed normally."""
+        # Mock with_structured_output to return a mock that directly returns BAResponse
+        mock_structured = SimpleNamespace(ainvoke=make_async_return(_PROJECT_RESPONSE))
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
 
-        assert result["status"] == "error"
-        assert "structured output" in result["error"].lower()
+        result = await run_ba_analysis("Build something", project_id="test-project-123")
+
+        assert result["status"] == "clarify"
 
     @pytest.mark.asyncio
-    async def test_request_with_project_id(self, mock_settings):
-        """Request with project_id should be processed normally."""
-        mock_ba_response = BAResponse(
-            title="Test",
-            description="Test",
-            user_stories=[],
-            questions=["Question 1?"],
-            priority=None,
-        )
+    async def test_structured_llm_reused_across_calls(self, mock_ba_env):
+        """The structured-output wrapper should be built once per LLM instance."""
+        mock_structured = SimpleNamespace(ainvoke=make_async_return(_PROJECT_RESPONSE))
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
 
-        with patch("app.agents.ba.get_llm_for_agent") as mock_get_llm:
-            mock_llm = mock_get_llm.return_value
-            # Mock with_structured_output to return a mock that directly returns BAResponse
-            mock_structured = AsyncMock()
-            mock_structured.ainvoke = AsyncMock(return_value=mock_ba_response)
-            mock_llm.with_structured_output = Mock(return_value=mock_structured)
+        await run_ba_analysis("Build something")
+        await run_ba_analysis("Build something else")
 
-            result = await run_ba_analysis(
-                "Build something", project_id="test-project-123"
-            )
+        assert mock_ba_env.with_structured_output.call_count == 1
 
-        assert result["status"] == "clarify"
+    @pytest.fixture
+    def response_cache(self, mock_ba_env, monkeypatch):
+        """Enable the BA response cache and empty it before and after the test."""
+        monkeypatch.setattr(ba.settings, "BA_CACHE_ENABLED", True)
+        ba._response_cache.clear()
+        yield ba._response_cache
+        ba._response_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_complete_response_served_from_cache(
+        self, response_cache, mock_ba_env
+    ):
+        """A repeated complete request should not call the LLM again."""
+        mock_structured = SimpleNamespace(ainvoke=make_async_return(_COMPLETE_RESPONSE))
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
+
+        first = await run_ba_analysis("Build a  login system")
+
+        # Any further LLM call would now fail
+        mock_structured.ainvoke = make_async_raise(Exception("LLM Error"))
+        second = await run_ba_analysis("Build a login system ")
+
+        assert first["status"] == "complete"
+        assert second["status"] == "complete"
+        assert second["response"] == first["response"]
+        # Callers get their own copy, never the cached user_stories list
+        assert second["user_stories"] is not first["user_stories"]
+        assert second["user_stories"] is second["response"].user_stories
+
+    @pytest.mark.asyncio
+    async def test_batch_results_match_request_order(self, mock_ba_env):
+        """Concurrent batch analysis should keep each result with its request."""
+
+        async def ainvoke_by_content(messages, *args, **kwargs):
+            if "vague" in messages[-1].content:
+                return _CLARIFY_RESPONSE
+            return _COMPLETE_RESPONSE
+
+        mock_structured = SimpleNamespace(ainvoke=ainvoke_by_content)
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
+
+        results = await run_ba_analysis_batch(
+            ["Build a login system", "", "Something vague"]
+        )
+
+        assert [r["status"] for r in results] == ["complete", "error", "clarify"]
 
 
 # ============================================================================
@@ -305,6 +407,26 @@ class TestResponseStructure:
         assert story.description == "As a user, I want X"
         assert len(story.acceptance_criteria) == 2
 
+    @pytest.mark.parametrize(
+        "response",
+        [
+            _CLARIFY_RESPONSE,
+            _COMPLETE_RESPONSE,
+            _PROJECT_RESPONSE,
+            _SPECIAL_CHARS_RESPONSE,
+        ],
+    )
+    def test_shared_responses_match_validated_models(self, response):
+        """Responses built with model_construct should survive full validation."""
+        assert BAResponse.model_validate(response.model_dump()) == response
+
+    def test_barresponse_is_immutable(self):
+        """BAResponse fields should not be reassignable once built."""
+        response = BAResponse(title="Test", description="Test")
+
+        with pytest.raises(ValidationError):
+            response.title = "Changed"
+
     def test_barresponse_optional_priority(self):
         """BAResponse priority should be optional."""
         response = BAResponse(
@@ -326,44 +448,32 @@ class TestResponseStructure:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_very_long_input_text(self):
-        """Very long input text should be handled."""
-        # Just under the limit
-        text = "a" * 9999
-        is_valid, _ = validate_request(text)
-        assert is_valid
-
-    def test_unicode_characters_in_input(self):
-        """Unicode characters should be handled."""
-        text = "Build a 登录 system with 🔐 security"
+    @pytest.mark.parametrize(
+        "text",
+        [_LEN_9999, _UNICODE_TEXT],
+        ids=["very_long_input_text", "unicode_characters_in_input"],
+    )
+    def test_edge_case_input_is_valid(self, text):
+        """Very long (just under the limit) and Unicode input should be handled."""
         is_valid, _ = validate_request(text)
         assert is_valid
 
-    @pytest.mark.asyncio
-    async def test_special_characters_in_structured_response(self):
+    @pytest.mark.parametrize(
+        "field, needle",
+        [("title", '"quoted"'), ("description", "\n"), ("description", "\t")],
+    )
+    def test_special_characters_in_structured_response(
+        self, mock_ba_env, field, needle
+    ):
         """Special characters in structured response should be handled correctly."""
-        with patch("app.agents.ba.settings") as mock:
-            mock.OPENROUTER_API_KEY = "test"
-            mock.OPENAI_MODEL = "test"
-            mock.OPENAI_API_BASE = "https://test.api/v1"
-
-            # Mock structured response with special characters
-            mock_ba_response = BAResponse(
-                title='Test "quoted" title',
-                description="Test with \n newlines and \t tabs",
-                user_stories=[],
-                questions=["Question with <special> & chars?"],
-                priority="high",
-            )
-
-            with patch("app.agents.ba.get_llm_for_agent") as mock_get_llm:
-                mock_llm = mock_get_llm.return_value
-                # Mock with_structured_output to return a mock that directly returns BAResponse
-                mock_structured = AsyncMock()
-                mock_structured.ainvoke = AsyncMock(return_value=mock_ba_response)
-                mock_llm.with_structured_output = Mock(return_value=mock_structured)
-
-                result = await run_ba_analysis("Test")
-
-            assert result["status"] == "clarify"
-            assert '"quoted"' in result["response"].title
+        # Mock with_structured_output to return a mock that directly returns BAResponse
+        mock_structured = SimpleNamespace(
+            ainvoke=make_async_return(_SPECIAL_CHARS_RESPONSE)
+        )
+        mock_ba_env.with_structured_output = Mock(return_value=mock_structured)
+
+        # Only one await is needed, so drive it directly instead of via pytest-asyncio
+        result = asyncio.run(run_ba_analysis("Test"))
+
+        assert result["status"] == "clarify"
+        assert needle in getattr(result["response"], field)